@@ -17,21 +17,21 @@ Features:
 
 import os
 import sys
+import errno
 import shutil
+import stat
 import logging
-import argparse
 import time
-from datetime import datetime
-from pathlib import Path
-from typing import List, Dict, Tuple, Optional
-import yaml
+import random
+import marshal
+import signal
+from types import SimpleNamespace
+from typing import List, Dict, Tuple, Optional, Iterator, TYPE_CHECKING
 
-# Try to import docling, provide helpful error if missing
-try:
+# Heavy dependencies (docling, yaml, multiprocessing) are imported where they
+# are first needed, so --help and --save-config start quickly
+if TYPE_CHECKING:
     from docling.document_converter import DocumentConverter
-except ImportError:
-    print("ERROR: docling package not found. Install with: pip install docling")
-    sys.exit(1)
 
 
 # ============================================================================
@@ -44,6 +44,8 @@ DEFAULT_CONFIG = {
     'max_file_size_mb': 100,
     'retry_attempts': 2,
     'retry_delay_seconds': 1.0,
+    'retry_max_delay_seconds': 30.0,
+    'num_workers': 1,
     'directories': {
         'inputs': './inputs',
         'outputs': './outputs',
@@ -52,6 +54,46 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Written by --save-config; must stay equivalent to DEFAULT_CONFIG
+_DEFAULT_CONFIG_YAML = """\
+# Document Conversion Pipeline Configuration
+
+# Input file types to process (extensions without dots)
+input_types:
+  - pdf
+
+# Output file types to generate (extensions without dots)
+output_types:
+  - md
+
+# Maximum file size in megabytes (files larger than this will be skipped)
+max_file_size_mb: 100
+
+# Retry configuration for failed conversions
+retry_attempts: 2
+retry_delay_seconds: 1.0
+retry_max_delay_seconds: 30.0
+
+# Number of parallel conversion processes (1 = sequential, 0 = half the CPU cores)
+num_workers: 1
+
+# Directory paths (relative or absolute)
+directories:
+  inputs: ./inputs
+  outputs: ./outputs
+  inputs_queue: ./inputs_queue
+  inputs_staging: ./inputs_staging
+"""
+
+# Section separator used in logs and run reports
+_BANNER = "=" * 70
+
+# Large content is written to disk in slices of this many characters/bytes
+WRITE_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Failures worth backing off for before retrying (others are retried immediately)
+TRANSIENT_ERRORS = (OSError, RuntimeError, MemoryError)
+
 EXPORT_METHODS = {
     'pdf': 'export_to_pdf',
     'docx': 'export_to_docx',
@@ -74,9 +116,10 @@ def setup_logging(log_level: str = 'INFO') -> logging.Logger:
     logger.handlers.clear()
     
     # Console handler
+    # No handler-level pin: the console shows whatever --log-level lets through
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_fmt = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    console_fmt = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s',
+                                    datefmt='%Y-%m-%d %H:%M:%S')
     console_handler.setFormatter(console_fmt)
     logger.addHandler(console_handler)
     
@@ -90,12 +133,72 @@ logger = setup_logging()
 # Configuration Management
 # ============================================================================
 
-def load_config(config_path: Optional[str] = None) -> Dict:
+def _config_cache_path(config_path: str) -> str:
+    """Return the marshal sidecar path used to cache a parsed config file."""
+    dir_name = os.path.dirname(config_path)
+    base_name = os.path.basename(config_path)
+    return os.path.join(dir_name, f".{base_name}.cache.marshal")
+
+
+def read_yaml_cached(config_path: str, write_cache: bool = True) -> Optional[Dict]:
+    """
+    Parse a YAML file, reusing a cached copy while the file is unchanged.
+    
+    The cache sidecar stores ((mtime_ns, size), parsed) and is only trusted
+    when that key still matches the YAML file, so edits are picked up on the
+    next run. It is serialized with marshal rather than pickle: the parsed
+    config is plain dicts/lists/scalars, and loading a planted sidecar must
+    not be able to run code. Values marshal can't encode (e.g. YAML dates)
+    just skip the cache. Cache read/write problems fall back to a normal parse.
+    
+    Args:
+        config_path: Path to YAML file
+        write_cache: If False, only read an existing cache, never create one
+        
+    Returns:
+        Parsed YAML content (None for an empty file)
+    """
+    st = os.stat(config_path)
+    key = (st.st_mtime_ns, st.st_size)
+    cache_path = _config_cache_path(config_path)
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, cached = marshal.load(f)
+        if cached_key == key:
+            logger.debug(f"Using cached config from {cache_path}")
+            return cached
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache {cache_path}: {e}")
+    
+    import yaml
+    # Prefer the libyaml C bindings when PyYAML was built with them
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    
+    with open(config_path, 'r', encoding='utf-8') as f:
+        parsed = yaml.load(f, Loader=Loader)
+    
+    if write_cache:
+        try:
+            atomic_write(cache_path, marshal.dumps((key, parsed)))
+        except Exception as e:
+            logger.debug(f"Could not write config cache {cache_path}: {e}")
+    
+    return parsed
+
+
+def load_config(config_path: Optional[str] = None, write_cache: bool = True) -> Dict:
     """
     Load configuration from YAML file or return defaults.
     
     Args:
         config_path: Path to config.yaml file
+        write_cache: If False, don't write the parsed-config cache (dry runs)
         
     Returns:
         Configuration dictionary
@@ -104,16 +207,15 @@ def load_config(config_path: Optional[str] = None) -> Dict:
     
     if config_path and os.path.exists(config_path):
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                user_config = yaml.safe_load(f)
-                if user_config:
-                    # Deep merge for nested dicts
-                    for key, value in user_config.items():
-                        if isinstance(value, dict) and key in config:
-                            config[key].update(value)
-                        else:
-                            config[key] = value
-                    logger.info(f"Loaded configuration from {config_path}")
+            user_config = read_yaml_cached(config_path, write_cache=write_cache)
+            if user_config:
+                # Deep merge for nested dicts
+                for key, value in user_config.items():
+                    if isinstance(value, dict) and key in config:
+                        config[key].update(value)
+                    else:
+                        config[key] = value
+                logger.info(f"Loaded configuration from {config_path}")
         except Exception as e:
             logger.error(f"Failed to load config from {config_path}: {e}")
             logger.info("Using default configuration")
@@ -124,14 +226,21 @@ def load_config(config_path: Optional[str] = None) -> Dict:
     return config
 
 
-def save_default_config(config_path: str = 'config.yaml'):
-    """Save default configuration to YAML file."""
+def save_default_config(config_path: str = 'config.yaml') -> bool:
+    """
+    Save default configuration to YAML file.
+    
+    Reports to stdout/stderr rather than the logger: --save-config output
+    is plain CLI output and shouldn't carry log timestamps and levels.
+    """
     try:
         with open(config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(DEFAULT_CONFIG, f, default_flow_style=False, sort_keys=False)
-        logger.info(f"Default configuration saved to {config_path}")
+            f.write(_DEFAULT_CONFIG_YAML)
+        print(f"Default configuration saved to {config_path}")
+        return True
     except Exception as e:
-        logger.error(f"Failed to save config to {config_path}: {e}")
+        print(f"ERROR: Failed to save config to {config_path}: {e}", file=sys.stderr)
+        return False
 
 
 # ============================================================================
@@ -174,6 +283,11 @@ def validate_config(config: Dict) -> None:
     if max_size <= 0:
         raise ValueError("max_file_size_mb must be positive")
     
+    # Validate worker count (0 = auto)
+    num_workers = config.get('num_workers', 1)
+    if not isinstance(num_workers, int) or num_workers < 0:
+        raise ValueError("num_workers must be a non-negative integer (0 = auto)")
+    
     logger.debug("Configuration validated successfully")
 
 
@@ -183,7 +297,9 @@ def validate_config(config: Dict) -> None:
 
 def now_stamp() -> str:
     """Generate timestamp string with microseconds to avoid collisions."""
-    return datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]  # milliseconds
+    now = time.time()
+    millis = int(now * 1000) % 1000
+    return f"{time.strftime('%Y%m%d_%H%M%S', time.localtime(now))}_{millis:03d}"
 
 
 def ensure_dir(path: str) -> None:
@@ -218,16 +334,36 @@ def format_duration(seconds: float) -> str:
 # File Discovery and Processing
 # ============================================================================
 
-def get_file_size(filepath: str) -> int:
-    """Get file size in bytes."""
+def _scan_files(directory: str, allowed: frozenset) -> Iterator[Tuple[str, int]]:
+    """
+    Recursively yield (path, size_bytes) for files with an allowed extension.
+    
+    Uses os.scandir so file-type checks come from cached directory entries,
+    and filters on the extension before touching the entry at all. The size
+    comes from the entry's own stat, so files are not stat'ed again later.
+    Like os.walk, symlinked directories are not followed and unreadable
+    directories are skipped.
+    """
     try:
-        return os.path.getsize(filepath)
-    except Exception as e:
-        logger.warning(f"Could not get size of {filepath}: {e}")
-        return 0
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan_files(entry.path, allowed)
+                    continue
+                
+                ext = os.path.splitext(entry.name)[1][1:].lower()
+                if ext in allowed and entry.is_file():
+                    try:
+                        size_bytes = entry.stat().st_size
+                    except OSError as e:
+                        logger.warning("Could not get size of %s: %s", entry.path, e)
+                        size_bytes = 0
+                    yield entry.path, size_bytes
+    except OSError as e:
+        logger.warning(f"Could not scan directory {directory}: {e}")
 
 
-def list_input_files(input_dir: str, allowed_types: List[str]) -> List[Tuple[str, str]]:
+def list_input_files(input_dir: str, allowed_types: List[str]) -> List[Tuple[str, str, int]]:
     """
     Recursively list all files with allowed extensions in input_dir.
     
@@ -236,53 +372,24 @@ def list_input_files(input_dir: str, allowed_types: List[str]) -> List[Tuple[str
         allowed_types: List of allowed file extensions (without dots)
         
     Returns:
-        List of tuples (absolute_path, relative_path_from_input_dir)
+        List of tuples (absolute_path, relative_path_from_input_dir, size_bytes)
     """
     files = []
     if not os.path.exists(input_dir):
         logger.warning(f"Input directory does not exist: {input_dir}")
         return files
     
-    input_root = Path(input_dir).resolve()
-    allowed = {ext.lower() for ext in allowed_types}
+    # Absolute root computed once; every discovered path is prefixed by it
+    input_root = os.path.abspath(input_dir)
+    root_len = len(input_root.rstrip(os.sep)) + 1
+    allowed = frozenset(ext.lower() for ext in allowed_types)
     
-    # Recursive walk through all subdirectories
-    for root, _, filenames in os.walk(input_dir):
-        for name in filenames:
-            full_path = os.path.join(root, name)
-            _, ext = os.path.splitext(name)
-            
-            if ext:
-                ext = ext.lower().lstrip('.')
-                if ext in allowed:
-                    # Resolve to absolute path first, then compute relative
-                    abs_path_obj = Path(full_path).resolve()
-                    abs_path = str(abs_path_obj)
-                    rel_path = str(abs_path_obj.relative_to(input_root))
-                    files.append((abs_path, rel_path))
+    for abs_path, size_bytes in _scan_files(input_root, allowed):
+        files.append((abs_path, abs_path[root_len:], size_bytes))
     
     return sorted(files, key=lambda x: x[1])  # Sort by relative path
 
 
-def check_file_size(filepath: str, max_size_mb: int) -> Tuple[bool, str]:
-    """
-    Check if file size is within limits.
-    
-    Returns:
-        Tuple of (is_valid, message)
-    """
-    try:
-        size_bytes = get_file_size(filepath)
-        size_mb = size_bytes / (1024 * 1024)
-        
-        if size_mb > max_size_mb:
-            return False, f"File size {format_bytes(size_bytes)} exceeds limit of {max_size_mb}MB"
-        
-        return True, f"Size: {format_bytes(size_bytes)}"
-    except Exception as e:
-        return False, f"Could not check file size: {e}"
-
-
 # ============================================================================
 # Directory Operations
 # ============================================================================
@@ -308,37 +415,54 @@ def move_contents(src_dir: str, dst_dir: str, overwrite: bool = True,
     ensure_dir(dst_dir)
     moved_count = 0
     
-    for entry in os.listdir(src_dir):
-        src_path = os.path.join(src_dir, entry)
-        dst_path = os.path.join(dst_dir, entry)
+    # Snapshot the listing first since entries are moved away while iterating
+    with os.scandir(src_dir) as it:
+        entries = list(it)
+    
+    for entry in entries:
+        src_path = entry.path
+        dst_path = os.path.join(dst_dir, entry.name)
         
         try:
-            if os.path.exists(dst_path):
+            # One lstat answers both "exists?" and "real directory?"
+            try:
+                dst_mode = os.lstat(dst_path).st_mode
+            except FileNotFoundError:
+                dst_mode = None
+            
+            if dst_mode is not None:
                 if overwrite:
-                    if os.path.isdir(dst_path) and not os.path.islink(dst_path):
+                    if stat.S_ISDIR(dst_mode):
                         shutil.rmtree(dst_path)
                     else:
                         os.remove(dst_path)
-                    logger.debug(f"Overwriting existing path at {dst_path}")
+                    logger.debug("Overwriting existing path at %s", dst_path)
                 else:
-                    logger.debug(f"Skipping existing path (no overwrite): {dst_path}")
+                    logger.debug("Skipping existing path (no overwrite): %s", dst_path)
                     continue
             
-            if preserve_metadata:
-                if os.path.isdir(src_path):
-                    shutil.copytree(src_path, dst_path, copy_function=shutil.copy2)
-                    shutil.rmtree(src_path)
+            try:
+                # Same-filesystem rename keeps the inode, so metadata is preserved
+                os.replace(src_path, dst_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # Cross-device: fall back to copy + delete
+                if preserve_metadata:
+                    if entry.is_dir():
+                        shutil.copytree(src_path, dst_path)
+                        shutil.rmtree(src_path)
+                    else:
+                        shutil.copy2(src_path, dst_path)
+                        os.remove(src_path)
                 else:
-                    shutil.copy2(src_path, dst_path)
-                    os.remove(src_path)
-            else:
-                shutil.move(src_path, dst_path)
+                    shutil.move(src_path, dst_path)
             
-            logger.debug(f"Moved {src_path} -> {dst_path}")
+            logger.debug("Moved %s -> %s", src_path, dst_path)
             moved_count += 1
             
         except Exception as e:
-            logger.error(f"Failed to move {src_path} to {dst_path}: {e}")
+            logger.error("Failed to move %s to %s: %s", src_path, dst_path, e)
     
     return moved_count
 
@@ -360,9 +484,27 @@ def atomic_write(path: str, content, mode: str = None) -> None:
     if mode is None:
         mode = "wb" if isinstance(content, (bytes, bytearray)) else "w"
     
+    encoding = None if mode == "wb" else "utf-8"
+    
     try:
-        with open(tmp_path, mode, encoding=None if mode == "wb" else "utf-8") as f:
-            f.write(content)
+        try:
+            f = open(tmp_path, mode, encoding=encoding)
+        except FileNotFoundError:
+            # Parent directory missing (callers normally pre-create it)
+            os.makedirs(dir_name, exist_ok=True)
+            f = open(tmp_path, mode, encoding=encoding)
+        
+        with f:
+            if isinstance(content, (str, bytes, bytearray)) and len(content) > WRITE_CHUNK_SIZE:
+                # Write large exports in slices so the encoded copy stays bounded;
+                # memoryview slices of bytes avoid copying each chunk
+                view = content if isinstance(content, str) else memoryview(content)
+                for start in range(0, len(content), WRITE_CHUNK_SIZE):
+                    f.write(view[start:start + WRITE_CHUNK_SIZE])
+            else:
+                f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
         
         # Atomic replace
         os.replace(tmp_path, path)
@@ -377,6 +519,56 @@ def atomic_write(path: str, content, mode: str = None) -> None:
         raise e
 
 
+def _plan_copytree(src_dir: str, dst_dir: str,
+                   file_pairs: List[Tuple[str, str]],
+                   dir_pairs: List[Tuple[str, str]]) -> None:
+    """Create dst_dir's directory skeleton and collect files to copy (scandir walk)."""
+    os.makedirs(dst_dir)
+    dir_pairs.append((src_dir, dst_dir))
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            dst_path = os.path.join(dst_dir, entry.name)
+            if entry.is_dir():
+                _plan_copytree(entry.path, dst_path, file_pairs, dir_pairs)
+            else:
+                file_pairs.append((entry.path, dst_path))
+
+
+def fast_copytree(src_dir: str, dst_dir: str, max_workers: int = 8) -> None:
+    """
+    Copy a directory tree, keeping several file copies in flight at once.
+    
+    The tree is enumerated once with os.scandir and directories are created
+    up front. Files are then copied with shutil.copy2 (sendfile on Linux,
+    fcopyfile on macOS) from a thread pool. The copies run in the kernel
+    without the GIL, so trees of many small files are no longer copied one
+    syscall round-trip at a time. Like shutil.copytree, symlinks are
+    followed and FileExistsError is raised if dst_dir already exists.
+    
+    Args:
+        src_dir: Source directory
+        dst_dir: Destination directory (must not exist)
+        max_workers: Maximum concurrent file copies
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    file_pairs = []
+    dir_pairs = []
+    _plan_copytree(src_dir, dst_dir, file_pairs, dir_pairs)
+    
+    if len(file_pairs) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_pairs))) as ex:
+            # list() surfaces the first copy error, if any
+            list(ex.map(lambda pair: shutil.copy2(*pair), file_pairs))
+    else:
+        for src_path, dst_path in file_pairs:
+            shutil.copy2(src_path, dst_path)
+    
+    # Directory metadata last, after their contents were written (as copytree)
+    for src_path, dst_path in reversed(dir_pairs):
+        shutil.copystat(src_path, dst_path)
+
+
 def snapshot_directory(src_dir: str, prefix: str) -> str:
     """
     Create timestamped snapshot copy of directory (non-destructive).
@@ -393,7 +585,7 @@ def snapshot_directory(src_dir: str, prefix: str) -> str:
     
     try:
         if os.path.exists(src_dir):
-            shutil.copytree(src_dir, dest_dir, copy_function=shutil.copy2)
+            fast_copytree(src_dir, dest_dir)
             logger.info(f"Snapshot created: {src_dir} -> {dest_dir}")
         else:
             os.makedirs(dest_dir, exist_ok=True)
@@ -402,13 +594,24 @@ def snapshot_directory(src_dir: str, prefix: str) -> str:
     except FileExistsError:
         # Handle unlikely timestamp collision
         alt = f"{dest_dir}_1"
-        shutil.copytree(src_dir, alt, copy_function=shutil.copy2)
+        fast_copytree(src_dir, alt)
         logger.warning(f"Snapshot destination existed; used {alt} instead")
         dest_dir = alt
         
     return dest_dir
 
 
+def _ensure_clean_dir(path: str) -> None:
+    """Best-effort removal of a directory, or a file sitting where one belongs."""
+    try:
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        elif os.path.lexists(path):
+            os.remove(path)
+    except Exception:
+        pass
+
+
 def rotate_inputs(inputs_dir: str, inputs_queue_dir: str, 
                  inputs_staging_dir: str) -> Tuple[str, int, int]:
     """
@@ -431,9 +634,9 @@ def rotate_inputs(inputs_dir: str, inputs_queue_dir: str,
     old_inputs_path = ""
     stamp = now_stamp()
     
-    logger.info("=" * 70)
+    logger.info(_BANNER)
     logger.info("ROTATION PHASE: Post-conversion input rotation")
-    logger.info("=" * 70)
+    logger.info(_BANNER)
     
     # Step 1: Rotate processed inputs
     if os.path.exists(inputs_dir):
@@ -443,21 +646,13 @@ def rotate_inputs(inputs_dir: str, inputs_queue_dir: str,
             logger.info(f"✓ Rotated processed files: {inputs_dir} -> {old_inputs_path}")
         except Exception as e:
             logger.error(f"Failed to rotate {inputs_dir} to {old_inputs_path}: {e}")
-            # Best effort: try to clear
-            if os.path.isdir(inputs_dir):
-                try:
-                    shutil.rmtree(inputs_dir)
-                except Exception:
-                    pass
+            # Best effort: clear whatever is left so it can be recreated
+            _ensure_clean_dir(inputs_dir)
     else:
         logger.info(f"No existing {inputs_dir} to rotate")
     
     # Step 2: Recreate empty inputs
     ensure_dir(inputs_dir)
-    if not os.path.isdir(inputs_dir):
-        if os.path.exists(inputs_dir):
-            os.remove(inputs_dir)
-        ensure_dir(inputs_dir)
     logger.info(f"✓ Created empty: {inputs_dir}")
     
     # Step 3: Staging -> Inputs (ready for next run)
@@ -476,11 +671,48 @@ def rotate_inputs(inputs_dir: str, inputs_queue_dir: str,
     
     # Log final state
     logger.info(f"Empty directories preserved: {inputs_queue_dir}, {inputs_staging_dir}")
-    logger.info("=" * 70)
+    logger.info(_BANNER)
     
     return old_inputs_path, staging_count, queue_count
 
 
+def _count_entries(path: str) -> int:
+    """Count the top-level entries of a directory (0 if it is missing)."""
+    try:
+        with os.scandir(path) as it:
+            return sum(1 for _ in it)
+    except OSError:
+        return 0
+
+
+def preview_rotation(inputs_dir: str, inputs_queue_dir: str,
+                     inputs_staging_dir: str) -> None:
+    """
+    Log the moves rotate_inputs() would make, without touching the filesystem.
+    
+    Args:
+        inputs_dir: Main input directory
+        inputs_queue_dir: Queue directory
+        inputs_staging_dir: Staging directory
+    """
+    logger.info(_BANNER)
+    logger.info("ROTATION PHASE: [DRY RUN] Post-conversion input rotation")
+    logger.info(_BANNER)
+    
+    if os.path.isdir(inputs_dir):
+        logger.info("[DRY RUN] Would rotate: %s -> ./inputs_old_<timestamp>", inputs_dir)
+    else:
+        logger.info("No existing %s to rotate", inputs_dir)
+    
+    staging_count = _count_entries(inputs_staging_dir)
+    logger.info("[DRY RUN] Would move %d items: %s -> %s",
+                staging_count, inputs_staging_dir, inputs_dir)
+    queue_count = _count_entries(inputs_queue_dir)
+    logger.info("[DRY RUN] Would move %d items: %s -> %s",
+                queue_count, inputs_queue_dir, inputs_staging_dir)
+    logger.info(_BANNER)
+
+
 # ============================================================================
 # Document Conversion
 # ============================================================================
@@ -501,31 +733,97 @@ def generate_output_filename(input_filename: str, input_ext: str, output_ext: st
     Returns:
         Output filename with collision-safe naming
     """
-    return f"{input_filename}_from_{input_ext}.{output_ext}"
+    return input_filename + "_from_" + input_ext + "." + output_ext
+
+
+# Process-wide DocumentConverter, shared by every process_conversions call
+_converter: Optional["DocumentConverter"] = None
+
 
+def get_converter() -> "DocumentConverter":
+    """
+    Return the process-wide DocumentConverter, creating it on first use.
+    
+    Model initialization is expensive, so repeated process_conversions calls
+    in the same process (library use, pool workers) reuse one instance. The
+    models stay loaded for the lifetime of the process.
+    """
+    global _converter
+    if _converter is None:
+        from docling.document_converter import DocumentConverter
+        _converter = DocumentConverter()
+    return _converter
 
-def convert_document(converter: DocumentConverter, input_path: str, output_path: str,
+
+# Whether an export method exists, keyed by (document class, output_ext)
+_EXPORT_CACHE: Dict[Tuple[type, str], bool] = {}
+
+
+def has_export_method(doc, output_ext: str) -> bool:
+    """
+    Check whether doc provides a callable export method for output_ext.
+    
+    The result is cached per document class, so the attribute lookup runs
+    once per (class, output type) instead of once per converted file.
+    """
+    key = (type(doc), output_ext)
+    found = _EXPORT_CACHE.get(key)
+    if found is None:
+        method_name = EXPORT_METHODS.get(output_ext)
+        found = bool(method_name) and callable(getattr(doc, method_name, None))
+        _EXPORT_CACHE[key] = found
+    return found
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    Compute a capped exponential backoff delay with jitter.
+    
+    The delay doubles with each attempt (starting at base_delay), is capped
+    at max_delay, and is then jittered to 50-150% so parallel workers that
+    fail together do not retry in lockstep.
+    
+    Args:
+        attempt: Retry attempt number (1 for the first retry)
+        base_delay: Delay before the first retry in seconds
+        max_delay: Upper bound on the un-jittered delay in seconds
+        
+    Returns:
+        Delay in seconds
+    """
+    delay = min(max_delay, base_delay * (2 ** (attempt - 1)))
+    return random.uniform(delay * 0.5, delay * 1.5)
+
+
+def convert_document(converter: "DocumentConverter", input_path: str, output_path: str,
                     output_ext: str, retry_attempts: int = 2,
-                    retry_delay: float = 1.0) -> Tuple[bool, str]:
+                    retry_delay: float = 1.0,
+                    retry_max_delay: float = 30.0) -> Tuple[bool, str]:
     """
     Convert document with retry logic and validation.
     
+    Retries after transient errors (I/O, runtime, memory) use exponential
+    backoff with jitter; other errors are retried without waiting.
+    
     Args:
         converter: DocumentConverter instance
         input_path: Source file path
         output_path: Destination file path
         output_ext: Output extension (for method lookup)
         retry_attempts: Number of retry attempts
-        retry_delay: Delay between retries in seconds
+        retry_delay: Base delay before the first retry in seconds
+        retry_max_delay: Maximum backoff delay in seconds
         
     Returns:
         Tuple of (success: bool, message: str)
     """
+    last_error = None
     for attempt in range(retry_attempts + 1):
         try:
             if attempt > 0:
-                logger.info(f"Retry attempt {attempt}/{retry_attempts} for {input_path}")
-                time.sleep(retry_delay)
+                logger.info("Retry attempt %d/%d for %s", attempt, retry_attempts, input_path)
+                if isinstance(last_error, TRANSIENT_ERRORS):
+                    time.sleep(backoff_delay(attempt, retry_delay, retry_max_delay))
             
             # Convert
             result = converter.convert(input_path)
@@ -540,13 +838,12 @@ def convert_document(converter: DocumentConverter, input_path: str, output_path:
             if not export_method_name:
                 return False, f"No export method mapping for output type: {output_ext}"
             
-            export_method = getattr(doc, export_method_name, None)
-            if not callable(export_method):
+            if not has_export_method(doc, output_ext):
                 available = [a for a in dir(doc) if a.startswith("export_to_")]
                 return False, f"Document missing method '{export_method_name}'. Available: {available}"
             
             # Export content
-            exported_content = export_method()
+            exported_content = getattr(doc, export_method_name)()
             
             # Validate content
             if exported_content is None:
@@ -556,25 +853,137 @@ def convert_document(converter: DocumentConverter, input_path: str, output_path:
                 if len(exported_content) == 0:
                     return False, "Export method returned empty content"
             
-            # Ensure output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
             # Write atomically
             atomic_write(output_path, exported_content)
             
             return True, "Success"
             
         except Exception as e:
+            last_error = e
             error_msg = f"Conversion error: {e}"
             if attempt < retry_attempts:
-                logger.warning(f"{error_msg} (will retry)")
+                logger.warning("%s (will retry)", error_msg)
             else:
-                logger.error(f"{error_msg} (max retries reached)")
+                logger.error("%s (max retries reached)", error_msg)
                 return False, error_msg
     
     return False, "Max retries reached"
 
 
+# ============================================================================
+# Parallel Conversion Workers
+# ============================================================================
+
+def resolve_num_workers(num_workers: int) -> int:
+    """
+    Resolve the configured worker count, where 0 means auto.
+    
+    Auto uses half the CPU cores: docling's layout and OCR models are
+    themselves multi-threaded, and each worker holds its own copy of them.
+    """
+    if num_workers == 0:
+        return max(1, (os.cpu_count() or 2) // 2)
+    return num_workers
+
+
+def _init_worker() -> None:
+    """Load the per-process DocumentConverter up front (pool initializer)."""
+    # Ctrl-C is handled by the parent, which cancels queued work; workers
+    # ignore SIGINT so in-flight documents finish instead of erroring out
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    get_converter()
+
+
+def _convert_one(task: Tuple[str, str, str, int, float, float]) -> Tuple[bool, str]:
+    """
+    Convert a single (input, output) pair inside a pool worker.
+    
+    Args:
+        task: Tuple of (input_path, output_path, output_ext,
+              retry_attempts, retry_delay, retry_max_delay)
+    
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    input_path, output_path, output_ext, retry_attempts, retry_delay, retry_max_delay = task
+    return convert_document(get_converter(), input_path, output_path,
+                            output_ext, retry_attempts, retry_delay, retry_max_delay)
+
+
+def run_conversion_tasks(tasks: List[Tuple[str, str, str, str, int]],
+                         converter: Optional["DocumentConverter"],
+                         num_workers: int, retry_attempts: int,
+                         retry_delay: float,
+                         retry_max_delay: float) -> Iterator[Tuple[Tuple[str, str, str, str, int], bool, str]]:
+    """
+    Execute conversion tasks sequentially or across a process pool.
+    
+    With num_workers == 1 (or a single task) tasks run in order on the given
+    converter, which keeps the original single-process behavior for
+    debugging. Otherwise the pool is capped at one worker per task, each
+    worker process builds its own DocumentConverter once, and results are
+    yielded in completion order.
+    
+    Args:
+        tasks: List of (input_rel_path, input_abs_path, output_path, output_ext,
+               size_bytes)
+        converter: DocumentConverter for the sequential path (built on demand
+                   if None; unused by the pool)
+        num_workers: Number of worker processes
+        retry_attempts: Number of retry attempts
+        retry_delay: Base delay before the first retry in seconds
+        retry_max_delay: Maximum backoff delay in seconds
+    
+    Yields:
+        Tuples of (task, success, message)
+    """
+    if num_workers <= 1 or len(tasks) <= 1:
+        if tasks and converter is None:
+            converter = get_converter()
+        total_tasks = len(tasks)
+        # Same throttle as the result log: at most ~100 INFO progress lines
+        report_every = max(1, total_tasks // 100)
+        for idx, task in enumerate(tasks, 1):
+            input_rel_path, input_abs_path, output_path, output_ext, _ = task
+            if idx % report_every == 0 or idx == 1 or idx == total_tasks:
+                logger.info("[%d/%d - %.1f%%] Processing: %s -> %s",
+                            idx, total_tasks, idx * 100.0 / total_tasks, input_rel_path, output_ext)
+            else:
+                logger.debug("  Processing: %s -> %s", input_rel_path, output_ext)
+            success, message = convert_document(
+                converter, input_abs_path, output_path, output_ext,
+                retry_attempts, retry_delay, retry_max_delay
+            )
+            yield task, success, message
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    
+    # Never start more workers (and model loads) than there are tasks
+    with ProcessPoolExecutor(max_workers=min(num_workers, len(tasks)),
+                             initializer=_init_worker) as ex:
+        try:
+            futures = {}
+            for task in tasks:
+                _, input_abs_path, output_path, output_ext, _ = task
+                future = ex.submit(_convert_one, (input_abs_path, output_path, output_ext,
+                                                  retry_attempts, retry_delay, retry_max_delay))
+                futures[future] = task
+            
+            for future in as_completed(futures):
+                task = futures[future]
+                try:
+                    success, message = future.result()
+                except Exception as e:
+                    success, message = False, f"Worker error: {e}"
+                yield task, success, message
+        except BaseException:
+            # Ctrl-C, or the consumer failing/closing the generator: drop the
+            # queued tasks so only documents already in flight are finished
+            ex.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
 # ============================================================================
 # Main Processing Pipeline
 # ============================================================================
@@ -588,7 +997,9 @@ class ConversionStats:
         self.failed = 0
         self.skipped = 0
         self.total_size_bytes = 0
-        self.failed_files = []
+        # Failed paths and reasons kept as parallel lists (no per-failure tuple)
+        self._failed_paths = []
+        self._failed_reasons = []
         self.start_time = time.time()
     
     def add_success(self, size_bytes: int = 0):
@@ -597,10 +1008,16 @@ class ConversionStats:
     
     def add_failure(self, filepath: str, reason: str):
         self.failed += 1
-        self.failed_files.append((filepath, reason))
+        self._failed_paths.append(filepath)
+        self._failed_reasons.append(reason)
     
-    def add_skip(self):
-        self.skipped += 1
+    @property
+    def failed_files(self) -> List[Tuple[str, str]]:
+        """List of (filepath, reason) for each failure."""
+        return list(zip(self._failed_paths, self._failed_reasons))
+    
+    def add_skip(self, count: int = 1):
+        self.skipped += count
     
     def elapsed_time(self) -> float:
         return time.time() - self.start_time
@@ -608,9 +1025,9 @@ class ConversionStats:
     def summary(self) -> List[str]:
         """Generate summary lines."""
         lines = []
-        lines.append("=" * 70)
+        lines.append(_BANNER)
         lines.append("CONVERSION STATISTICS")
-        lines.append("=" * 70)
+        lines.append(_BANNER)
         lines.append(f"Total files discovered: {self.total_files}")
         lines.append(f"Successful conversions: {self.successful}")
         lines.append(f"Failed conversions: {self.failed}")
@@ -618,13 +1035,13 @@ class ConversionStats:
         lines.append(f"Total data processed: {format_bytes(self.total_size_bytes)}")
         lines.append(f"Total runtime: {format_duration(self.elapsed_time())}")
         
-        if self.failed_files:
+        if self._failed_paths:
             lines.append("")
             lines.append("Failed Files:")
-            for filepath, reason in self.failed_files:
+            for filepath, reason in zip(self._failed_paths, self._failed_reasons):
                 lines.append(f"  - {filepath}: {reason}")
         
-        lines.append("=" * 70)
+        lines.append(_BANNER)
         return lines
 
 
@@ -650,21 +1067,23 @@ def process_conversions(config: Dict, dry_run: bool = False) -> ConversionStats:
     max_size_mb = config['max_file_size_mb']
     retry_attempts = config.get('retry_attempts', 2)
     retry_delay = config.get('retry_delay_seconds', 1.0)
+    retry_max_delay = config.get('retry_max_delay_seconds', 30.0)
+    num_workers = resolve_num_workers(config.get('num_workers', 1))
     
-    # Initialize converter (skip in dry-run)
+    # Initialize converter (skip in dry-run; pool workers build their own)
     converter = None
-    if not dry_run:
+    if not dry_run and num_workers <= 1:
         try:
-            converter = DocumentConverter()
+            converter = get_converter()
             logger.info("DocumentConverter initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize DocumentConverter: {e}")
             raise
     
     # Discover input files
-    logger.info("=" * 70)
+    logger.info(_BANNER)
     logger.info("DISCOVERY PHASE: Scanning for input files")
-    logger.info("=" * 70)
+    logger.info(_BANNER)
     
     input_files = list_input_files(inputs_dir, input_types)
     stats.total_files = len(input_files)
@@ -673,111 +1092,167 @@ def process_conversions(config: Dict, dry_run: bool = False) -> ConversionStats:
     logger.info(f"Input types: {input_types}")
     logger.info(f"Output types: {output_types}")
     logger.info(f"Recursive processing: ENABLED")
-    logger.info("=" * 70)
+    logger.info(_BANNER)
     
     if len(input_files) == 0:
         logger.warning("No input files found to process")
         return stats
     
-    # Prepare run report
-    run_report = []
-    run_report.append(f"Document Conversion Run Report")
-    run_report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    run_report.append(f"Mode: {'DRY RUN' if dry_run else 'PRODUCTION'}")
-    run_report.append(f"")
-    run_report.append(f"Configuration:")
-    run_report.append(f"  Input types: {input_types}")
-    run_report.append(f"  Output types: {output_types}")
-    run_report.append(f"  Max file size: {max_size_mb}MB")
-    run_report.append(f"  Inputs directory: {inputs_dir}")
-    run_report.append(f"  Outputs directory: {outputs_dir}")
-    run_report.append(f"  Retry attempts: {retry_attempts}")
-    run_report.append(f"")
-    run_report.append(f"Files discovered: {len(input_files)}")
-    run_report.append(f"")
-    
-    # Process conversions
-    logger.info("=" * 70)
-    logger.info("CONVERSION PHASE: Processing documents")
-    logger.info("=" * 70)
-    
-    for idx, (input_abs_path, input_rel_path) in enumerate(input_files, 1):
-        # Progress reporting
-        progress_pct = (idx / len(input_files)) * 100
-        logger.info(f"[{idx}/{len(input_files)} - {progress_pct:.1f}%] Processing: {input_rel_path}")
-        
-        # Check file size
-        is_valid, size_msg = check_file_size(input_abs_path, max_size_mb)
-        if not is_valid:
-            logger.warning(f"Skipping {input_rel_path}: {size_msg}")
-            stats.add_failure(input_rel_path, size_msg)
-            run_report.append(f"SKIPPED (size): {input_rel_path} - {size_msg}")
-            continue
-        else:
-            logger.debug(f"  {size_msg}")
-        
-        # Extract info
-        input_filename_no_ext = os.path.splitext(os.path.basename(input_rel_path))[0]
-        _, input_ext = os.path.splitext(input_rel_path)
-        input_ext = input_ext.lower().lstrip('.')
-        
-        # Get directory structure for mirroring
-        rel_dir = os.path.dirname(input_rel_path)
+    # Open run report up front and write it incrementally (line-buffered),
+    # so memory stays flat and partial progress survives an interrupted run.
+    # Dry runs write nothing to disk, so their report goes to os.devnull.
+    report_path = None
+    if not dry_run:
+        report_filename = f"run_report_{now_stamp()}.txt"
+        report_path = os.path.join(outputs_dir, report_filename)
+        try:
+            ensure_dir(outputs_dir)
+            report_f = open(report_path, 'w', buffering=1, encoding='utf-8')
+        except Exception as e:
+            logger.error(f"Failed to write run report to {report_path}: {e}")
+            report_path = None
+    if report_path is None:
+        report_f = open(os.devnull, 'w', encoding='utf-8')
+    
+    report_f.write(
+        f"Document Conversion Run Report\n"
+        f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        f"Mode: {'DRY RUN' if dry_run else 'PRODUCTION'}\n"
+        f"\n"
+        f"Configuration:\n"
+        f"  Input types: {input_types}\n"
+        f"  Output types: {output_types}\n"
+        f"  Max file size: {max_size_mb}MB\n"
+        f"  Inputs directory: {inputs_dir}\n"
+        f"  Outputs directory: {outputs_dir}\n"
+        f"  Retry attempts: {retry_attempts}\n"
+        f"  Worker processes: {num_workers}\n"
+        f"\n"
+        f"Files discovered: {len(input_files)}\n"
+        f"\n"
+    )
+    
+    try:
+        # Process conversions
+        logger.info(_BANNER)
+        logger.info("CONVERSION PHASE: Processing documents")
+        logger.info(_BANNER)
         
-        # Convert to each output type
-        for output_ext in output_types:
-            if output_ext == input_ext:
-                logger.debug(f"  Skipping same-type conversion: {output_ext}")
-                stats.add_skip()
+        # Build conversion task list:
+        # (input_rel_path, input_abs_path, output_path, output_ext, size_bytes)
+        max_size_bytes = max_size_mb * 1024 * 1024
+        tasks = []
+        targets_by_ext = {}
+        out_root = outputs_dir.rstrip(os.sep) + os.sep
+        total_files = len(input_files)
+        for idx, (input_abs_path, input_rel_path, size_bytes) in enumerate(input_files, 1):
+            # Only planning happens here; per-conversion progress is logged
+            # when each conversion actually starts (see run_conversion_tasks)
+            logger.debug("[%d/%d] Planning: %s", idx, total_files, input_rel_path)
+            
+            # Check file size (size was captured during discovery)
+            if size_bytes > max_size_bytes:
+                size_msg = f"File size {format_bytes(size_bytes)} exceeds limit of {max_size_mb}MB"
+                logger.warning("Skipping %s: %s", input_rel_path, size_msg)
+                stats.add_failure(input_rel_path, size_msg)
+                report_f.write(f"SKIPPED (size): {input_rel_path} - {size_msg}\n")
                 continue
+            else:
+                logger.debug("  Size: %s", format_bytes(size_bytes))
             
-            # Generate collision-safe output filename
-            output_filename = generate_output_filename(input_filename_no_ext, input_ext, output_ext)
+            # Extract info
+            input_filename_no_ext = os.path.splitext(os.path.basename(input_rel_path))[0]
+            _, input_ext = os.path.splitext(input_rel_path)
+            input_ext = input_ext.lower().lstrip('.')
             
             # Mirror directory structure in outputs
-            if rel_dir:
-                output_path = os.path.join(outputs_dir, rel_dir, output_filename)
-            else:
-                output_path = os.path.join(outputs_dir, output_filename)
+            rel_dir = os.path.dirname(input_rel_path)
+            out_dir = out_root + rel_dir + os.sep if rel_dir else out_root
             
-            logger.info(f"  Converting to {output_ext}: {output_filename}")
+            # Output types to convert to (same-type conversions are skipped)
+            targets = targets_by_ext.get(input_ext)
+            if targets is None:
+                targets = [o for o in output_types if o != input_ext]
+                targets_by_ext[input_ext] = targets
             
-            if dry_run:
-                logger.info(f"  [DRY RUN] Would create: {output_path}")
-                stats.add_success()
-                run_report.append(f"[DRY RUN] {input_rel_path} -> {output_path}")
-            else:
-                success, message = convert_document(
-                    converter, input_abs_path, output_path, output_ext,
-                    retry_attempts, retry_delay
-                )
+            skips = len(output_types) - len(targets)
+            if skips:
+                logger.debug("  Skipping same-type conversion: %s", input_ext)
+                stats.add_skip(skips)
+            
+            # Convert to each output type
+            for output_ext in targets:
+                # Generate collision-safe output filename
+                output_filename = generate_output_filename(input_filename_no_ext, input_ext, output_ext)
                 
-                if success:
-                    file_size = get_file_size(input_abs_path)
-                    stats.add_success(file_size)
-                    logger.info(f"  ✓ Success: {output_path}")
-                    run_report.append(f"SUCCESS: {input_rel_path} -> {output_path}")
+                output_path = out_dir + output_filename
+                
+                if dry_run:
+                    logger.info("  [DRY RUN] Would create: %s", output_path)
+                    stats.add_success()
+                    report_f.write(f"[DRY RUN] {input_rel_path} -> {output_path}\n")
                 else:
-                    stats.add_failure(input_rel_path, message)
-                    logger.error(f"  ✗ Failed: {message}")
-                    run_report.append(f"FAILED: {input_rel_path} -> {output_path} ({message})")
-    
-    # Add statistics to report
-    run_report.append("")
-    run_report.extend(stats.summary())
-    
-    # Save report with timestamp
-    report_filename = f"run_report_{now_stamp()}.txt"
-    report_path = os.path.join(outputs_dir, report_filename)
-    
-    try:
-        ensure_dir(outputs_dir)
-        atomic_write(report_path, "\n".join(run_report))
-        logger.info(f"Run report saved to: {report_path}")
-    except Exception as e:
-        logger.error(f"Failed to write run report to {report_path}: {e}")
+                    logger.debug("  Queued %s: %s", output_ext, output_filename)
+                    tasks.append((input_rel_path, input_abs_path, output_path, output_ext, size_bytes))
+        
+        # Create each distinct output directory once, before any conversion runs.
+        # A directory that can't be created fails only the tasks writing into it.
+        bad_dirs = {}
+        for output_dir in {os.path.dirname(task[2]) for task in tasks}:
+            try:
+                ensure_dir(output_dir)
+            except OSError as e:
+                bad_dirs[output_dir] = f"Could not create output directory {output_dir}: {e}"
+        
+        if bad_dirs:
+            runnable = []
+            for task in tasks:
+                message = bad_dirs.get(os.path.dirname(task[2]))
+                if message is None:
+                    runnable.append(task)
+                    continue
+                input_rel_path, _, output_path, output_ext, _ = task
+                stats.add_failure(input_rel_path, message)
+                logger.error("  ✗ Failed: %s -> %s: %s", input_rel_path, output_ext, message)
+                report_f.write(f"FAILED: {input_rel_path} -> {output_path} ({message})\n")
+            tasks = runnable
+        
+        # Execute conversions (sequentially or across the worker pool)
+        if tasks:
+            logger.info(f"Converting {len(tasks)} documents with {num_workers} worker(s)")
+        
+        results = run_conversion_tasks(tasks, converter, num_workers,
+                                       retry_attempts, retry_delay, retry_max_delay)
+        total_tasks = len(tasks)
+        report_every = max(1, total_tasks // 100)
+        for done, (task, success, message) in enumerate(results, 1):
+            input_rel_path, _, output_path, output_ext, size_bytes = task
+            
+            if success:
+                stats.add_success(size_bytes)
+                if done % report_every == 0 or done == total_tasks:
+                    logger.info("[%d/%d - %.1f%%] ✓ Success: %s",
+                                done, total_tasks, done * 100.0 / total_tasks, output_path)
+                else:
+                    logger.debug("  ✓ Success: %s", output_path)
+                report_f.write(f"SUCCESS: {input_rel_path} -> {output_path}\n")
+            else:
+                stats.add_failure(input_rel_path, message)
+                logger.error("  ✗ Failed: %s -> %s: %s", input_rel_path, output_ext, message)
+                report_f.write(f"FAILED: {input_rel_path} -> {output_path} ({message})\n")
+        
+    finally:
+        # Statistics are appended even if processing was interrupted
+        try:
+            report_f.write("\n")
+            report_f.write("\n".join(stats.summary()))
+            report_f.close()
+            if report_path:
+                logger.info(f"Run report saved to: {report_path}")
+        except Exception as e:
+            logger.error(f"Failed to write run report to {report_path}: {e}")
     
-    logger.info("=" * 70)
+    logger.info(_BANNER)
     
     return stats
 
@@ -786,8 +1261,75 @@ def process_conversions(config: Dict, dry_run: bool = False) -> ConversionStats:
 # CLI and Main Entry Point
 # ============================================================================
 
+# Options understood by the argparse-free fast path (see _fast_parse_arguments)
+_CLI_SWITCHES = {
+    '--save-config': 'save_config',
+    '--dry-run': 'dry_run',
+}
+_CLI_OPTIONS = {
+    '--config': 'config',
+    '--log-level': 'log_level',
+    '--inputs': 'inputs',
+    '--outputs': 'outputs',
+    '--inputs-queue': 'inputs_queue',
+    '--inputs-staging': 'inputs_staging',
+    '--num-workers': 'num_workers',
+}
+_LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR']
+
+
+def _fast_parse_arguments(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the common, well-formed command lines without building argparse.
+    
+    Handles exactly the long options of parse_arguments (as "--opt value"
+    or "--opt=value"). Returns None for anything else (--help, abbreviated
+    or unknown options, invalid values) so argparse can handle it and
+    produce its usual help and error messages.
+    """
+    args = SimpleNamespace(config='config.yaml', save_config=False, dry_run=False,
+                           log_level='INFO', inputs=None, outputs=None,
+                           inputs_queue=None, inputs_staging=None, num_workers=None)
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in _CLI_SWITCHES:
+            setattr(args, _CLI_SWITCHES[arg], True)
+        else:
+            name, sep, value = arg.partition('=')
+            dest = _CLI_OPTIONS.get(name)
+            if dest is None:
+                return None
+            if not sep:
+                i += 1
+                if i >= len(argv) or argv[i].startswith('-'):
+                    return None
+                value = argv[i]
+            setattr(args, dest, value)
+        i += 1
+    
+    if args.log_level not in _LOG_LEVELS:
+        return None
+    if args.num_workers is not None:
+        try:
+            args.num_workers = int(args.num_workers)
+        except ValueError:
+            return None
+    
+    return args
+
+
 def parse_arguments():
     """Parse command-line arguments."""
+    args = _fast_parse_arguments(sys.argv[1:])
+    if args is not None:
+        return args
+    
+    import argparse
+    # The script's help and errors are English-only; bypass argparse's
+    # gettext lookups, which stat for .mo catalogs on every message
+    argparse._ = lambda message: message
+    argparse.ngettext = lambda singular, plural, n: singular if n == 1 else plural
     parser = argparse.ArgumentParser(
         description="Document Conversion Pipeline with Rotation and Staging",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -810,6 +1352,9 @@ Examples:
   
   # Enable verbose logging
   python script.py --log-level DEBUG
+  
+  # Convert with 4 parallel worker processes
+  python script.py --num-workers 4
         """
     )
     
@@ -823,7 +1368,7 @@ Examples:
                        help='Simulate operations without executing conversions')
     
     parser.add_argument('--log-level', type=str, default='INFO',
-                       choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                       choices=_LOG_LEVELS,
                        help='Logging level (default: INFO)')
     
     # Directory overrides
@@ -836,6 +1381,11 @@ Examples:
     parser.add_argument('--inputs-staging', type=str,
                        help='Override inputs_staging directory path')
     
+    # Processing overrides
+    parser.add_argument('--num-workers', type=int,
+                       help='Number of parallel conversion processes '
+                            '(1 = sequential, 0 = half the CPU cores)')
+    
     return parser.parse_args()
 
 
@@ -843,26 +1393,25 @@ def main():
     """Main entry point for the conversion pipeline."""
     args = parse_arguments()
     
+    # Handle save-config (exits before logging is reconfigured)
+    if args.save_config:
+        return 0 if save_default_config(args.config) else 1
+    
     # Setup logging
     global logger
     logger = setup_logging(args.log_level)
     
-    # Handle save-config
-    if args.save_config:
-        save_default_config(args.config)
-        return 0
-    
-    logger.info("=" * 70)
+    logger.info(_BANNER)
     logger.info("DOCUMENT CONVERSION PIPELINE")
-    logger.info("=" * 70)
-    logger.info(f"Start time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(_BANNER)
+    logger.info("Pipeline started")
     
     if args.dry_run:
         logger.info("MODE: DRY RUN (no actual conversions will be performed)")
     
     try:
         # Load configuration
-        config = load_config(args.config)
+        config = load_config(args.config, write_cache=not args.dry_run)
         
         # Apply CLI overrides
         if args.inputs:
@@ -873,10 +1422,19 @@ def main():
             config['directories']['inputs_queue'] = args.inputs_queue
         if args.inputs_staging:
             config['directories']['inputs_staging'] = args.inputs_staging
+        if args.num_workers is not None:
+            config['num_workers'] = args.num_workers
         
         # Validate configuration
         validate_config(config)
         
+        # docling is imported lazily; fail fast with a helpful error if missing
+        if not args.dry_run:
+            import importlib.util
+            if importlib.util.find_spec("docling") is None:
+                print("ERROR: docling package not found. Install with: pip install docling")
+                return 1
+        
         # Extract directories
         dirs = config['directories']
         inputs_dir = dirs['inputs']
@@ -884,25 +1442,28 @@ def main():
         inputs_queue_dir = dirs['inputs_queue']
         inputs_staging_dir = dirs['inputs_staging']
         
-        # Ensure base directories exist
-        ensure_dir(outputs_dir)
-        ensure_dir(inputs_queue_dir)
-        ensure_dir(inputs_staging_dir)
-        ensure_dir(inputs_dir)  # Ensure inputs exists before processing
-        
-        # Snapshot outputs (before conversion, preserves previous run)
-        if not args.dry_run:
+        if args.dry_run:
+            # Preview only: nothing is created, snapshotted or rotated
+            stats = process_conversions(config, dry_run=True)
+            logger.info("")
+            preview_rotation(inputs_dir, inputs_queue_dir, inputs_staging_dir)
+        else:
+            # Ensure base directories exist (inputs too, before processing)
+            for base_dir in (outputs_dir, inputs_queue_dir, inputs_staging_dir, inputs_dir):
+                ensure_dir(base_dir)
+            
+            # Snapshot outputs (before conversion, preserves previous run)
             outputs_snapshot = snapshot_directory(outputs_dir, "outputs")
-            logger.info(f"Previous outputs preserved at: {outputs_snapshot}")
-        
-        # Process conversions FIRST (convert what's currently in inputs)
-        stats = process_conversions(config, dry_run=args.dry_run)
-        
-        # Execute input rotation AFTER conversion
-        logger.info("")
-        rotated_input, queue_moved, staging_moved = rotate_inputs(
-            inputs_dir, inputs_queue_dir, inputs_staging_dir
-        )
+            logger.info("Previous outputs preserved at: %s", outputs_snapshot)
+            
+            # Process conversions FIRST (convert what's currently in inputs)
+            stats = process_conversions(config)
+            
+            # Execute input rotation AFTER conversion
+            logger.info("")
+            rotated_input, queue_moved, staging_moved = rotate_inputs(
+                inputs_dir, inputs_queue_dir, inputs_staging_dir
+            )
         
         # Final summary
         logger.info("")
@@ -910,14 +1471,14 @@ def main():
             logger.info(line)
         
         logger.info("")
-        logger.info(f"End time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info("=" * 70)
+        logger.info("Pipeline finished")
+        logger.info(_BANNER)
         
         # Return appropriate exit code
         return 0 if stats.failed == 0 else 1
         
     except Exception as e:
-        logger.exception(f"Fatal error: {e}")
+        logger.exception("Fatal error: %s", e)
         return 1
 
 
@@ -1,15 +1,54 @@
-from docling.document_converter import DocumentConverter
-import os
+import argparse
+import functools
+import urllib.parse
+from pathlib import Path
 
-source = "https://arxiv.org/pdf/2408.09869"  # document per local path or URL
-output_dir = "./output"
+# Document extensions dropped from URL filenames ("paper.pdf" -> "paper.md")
+DOCUMENT_SUFFIXES = {".pdf", ".docx", ".pptx", ".xlsx", ".html", ".htm",
+                     ".md", ".csv", ".png", ".jpg", ".jpeg", ".tif", ".tiff"}
 
-converter = DocumentConverter()
-result = converter.convert(source)
 
-os.makedirs(output_dir, exist_ok=True)
-output_path = os.path.join(output_dir, "f{test-docling-output.md}")
-with open(output_path, "w", encoding="utf-8") as f:
-    f.write(result.document.export_to_markdown())
+@functools.lru_cache(maxsize=1)
+def get_converter():
+    # Imported here so --help and argument errors don't load the docling stack;
+    # cached so the layout/OCR models load once per process
+    from docling.document_converter import DocumentConverter
+    return DocumentConverter()
 
-print(result.document.export_to_markdown())  # output: "## Docling Technical Report[...]"
\ No newline at end of file
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert a document with docling and print it as Markdown")
+    parser.add_argument("source", nargs="?", default="https://arxiv.org/pdf/2408.09869",
+                        help="document per local path or URL")
+    parser.add_argument("--output-dir", default="./output",
+                        help="directory for the Markdown output (default: ./output)")
+    args = parser.parse_args()
+
+    source = args.source
+
+    # Name the output after the source: local files drop their extension;
+    # URLs use their last path segment without the query string, dropping
+    # only a real document extension (so arXiv's 2408.09869 stays intact)
+    if "://" in source:
+        url = urllib.parse.urlsplit(source)
+        name = Path(url.path).name or url.hostname or "output"
+        if Path(name).suffix.lower() in DOCUMENT_SUFFIXES:
+            name = Path(name).stem
+    else:
+        name = Path(source).stem
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"{name}.md"
+
+    result = get_converter().convert(source)
+
+    # Export once; markdown export walks the whole document tree
+    md = result.document.export_to_markdown()
+    # Encode once and write bytes, skipping the text-mode codec layer
+    output_path.write_bytes(md.encode("utf-8"))
+
+    print(md)  # output: "## Docling Technical Report[...]"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Keep the commented default-config template in sync with DEFAULT_CONFIG."""
+import importlib.util
+from pathlib import Path
+
+import yaml
+
+SCRIPT = Path(__file__).resolve().parent.parent / "docling-inputs2outputs.py"
+
+
+def load_pipeline():
+    # The script name has hyphens, so it can't be imported by name
+    spec = importlib.util.spec_from_file_location("docling_inputs2outputs", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_default_config_template_matches_defaults():
+    pipeline = load_pipeline()
+    assert yaml.safe_load(pipeline._DEFAULT_CONFIG_YAML) == pipeline.DEFAULT_CONFIG